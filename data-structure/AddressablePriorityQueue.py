@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:05:17 2026
+
+@author: ASUS
+
+Max-priority queue on a pairing heap with a name -> node index, so queued
+items can be looked up, re-prioritised and removed by name, and two queues
+can be melded without rebuilding either of them.
+
+Names are unique keys: enqueueing a name that is already queued raises
+ValueError, as in PriorityQueue. Equal priorities come out in FIFO order, and
+an updated item goes to the back of the line among items of its new priority
+whichever way its priority moved.
+
+    enqueue                   O(1)
+    get, contains, front      O(1)
+    merge                     O(min(n, m)) to merge the name indexes, O(1) heap link
+    dequeue, remove, update   O(log n) amortized
+    pop_many(k)               O(k log n) amortized
+"""
+import itertools
+
+# Shared by every queue so FIFO order among equal priorities still holds
+# after two queues are merged
+_counter = itertools.count()
+
+class Node:
+    def __init__(self, name, pri):
+        self.name = name
+        self.pri = pri
+        self.seq = next(_counter)
+        self.child = None
+        self.sibling = None
+        # Parent when this is the leftmost child, left sibling otherwise
+        self.prev = None
+
+def _beats(a, b):
+    return a.pri > b.pri or (a.pri == b.pri and a.seq < b.seq)
+
+def _link(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if _beats(b, a):
+        a, b = b, a
+    b.prev = a
+    b.sibling = a.child
+    if a.child is not None:
+        a.child.prev = b
+    a.child = b
+    a.sibling = a.prev = None
+    return a
+
+def _mergePairs(first):
+    # Standard two-pass combine: link siblings pairwise left to right, then
+    # fold the results into one tree right to left
+    pairs = []
+    while first is not None:
+        a = first
+        b = a.sibling
+        first = b.sibling if b is not None else None
+        a.sibling = a.prev = None
+        if b is not None:
+            b.sibling = b.prev = None
+        pairs.append(_link(a, b))
+    root = None
+    while pairs:
+        root = _link(pairs.pop(), root)
+    return root
+
+class AddressablePriorityQueue:
+    def __init__(self):
+        self.root = None
+        self.index = {}
+    def enqueue(self, name, pri):
+        if name in self.index:
+            raise ValueError('Name {0!r} is already queued'.format(name))
+        node = Node(name, pri)
+        self.index[name] = node
+        self.root = _link(self.root, node)
+    def update(self, name, pri):
+        node = self.index[name]
+        if pri > node.pri:
+            # Raising a key only needs the subtree cut off and relinked. Its
+            # children still lose to it on priority alone, so it can take a
+            # fresh seq like the remove + enqueue path below.
+            node.seq = next(_counter)
+            if node is not self.root:
+                self._cut(node)
+                node.pri = pri
+                self.root = _link(self.root, node)
+            else:
+                node.pri = pri
+        else:
+            self.remove(name)
+            self.enqueue(name, pri)
+    def remove(self, name):
+        node = self.index.pop(name)
+        if node is self.root:
+            self.root = _mergePairs(node.child)
+        else:
+            self._cut(node)
+            self.root = _link(self.root, _mergePairs(node.child))
+        node.child = None
+        return node.name, node.pri
+    def get(self, name):
+        return self.index[name].pri
+    def contains(self, name):
+        return name in self.index
+    def dequeue(self):
+        if self.isEmpty():
+            print('Nothing to dequeue')
+        else:
+            return self.remove(self.root.name)
+    def pop_many(self, k):
+        result = []
+        while k > 0 and self.root is not None:
+            result.append(self.remove(self.root.name))
+            k -= 1
+        return result
+    def merge(self, other):
+        # Meld other into this queue and leave other empty. Only the smaller
+        # index is walked, to check for clashing names and copy it across.
+        if other is self or other.root is None:
+            return
+        small, large = self.index, other.index
+        if len(small) > len(large):
+            small, large = large, small
+        for name in small:
+            if name in large:
+                raise ValueError('Name {0!r} is queued in both queues'.format(name))
+        large.update(small)
+        self.index = large
+        self.root = _link(self.root, other.root)
+        other.root = None
+        other.index = {}
+    def isEmpty(self):
+        return self.root is None
+    def size(self):
+        return len(self.index)
+    def front(self):
+        return self.root.name, self.root.pri
+    def _cut(self, node):
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+
+if __name__ == '__main__':
+    a = AddressablePriorityQueue()
+    for name, pri in [('build', 2), ('test', 5), ('lint', 1), ('deploy', 5)]:
+        a.enqueue(name, pri)
+    b = AddressablePriorityQueue()
+    b.enqueue('docs', 3)
+    b.enqueue('release', 0)
+    a.merge(b)
+    a.update('lint', 4)
+    a.remove('release')
+    print(a.contains('docs'), a.get('lint'), a.size())
+    print(a.front())
+    print(a.pop_many(3))
+    while a.isEmpty() == False:
+        print(a.dequeue())
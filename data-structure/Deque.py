@@ -3,5 +3,225 @@
 Created on Thu May 24 23:29:31 2018
 
 @author: ASUS
+
+Double-ended queue laid out the way CPython's collections.deque is: a doubly
+linked list of fixed-size blocks instead of one node per item. Appends and
+pops at either end only touch the end blocks, and a block is allocated or
+released once every BLOCKLEN items instead of on every call.
+
+    append, appendleft, pop, popleft   O(1)
+    rotate(k)                          O(min(k, n - k)), O(1) per step
+    d[i], islice(i, j)                 O(min(i, n - i) / BLOCKLEN) to reach i
+    d[i:j:k]                           the same to reach the slice, then O(j - i)
+
+Slicing returns a new Deque. As with collections.deque, adding or removing
+items while iterating raises RuntimeError; assigning to d[i] does not.
 """
+import operator
+
+BLOCKLEN = 64
+CENTER = (BLOCKLEN - 1) // 2
+
+class Block:
+    def __init__(self):
+        self.data = [None] * BLOCKLEN
+        self.left = None
+        self.right = None
+
+class Deque:
+    def __init__(self, iterable=(), maxlen=None):
+        if maxlen is not None and maxlen < 0:
+            raise ValueError('maxlen must be non-negative')
+        self.maxlen = maxlen
+        # Bumped by every append and pop so iterators can spot a mutation
+        self.state = 0
+        self.clear()
+        self.extend(iterable)
+    def clear(self):
+        # An empty deque is a single block with the indexes crossed in the
+        # middle, so the first append or appendleft has room on both sides
+        self.leftblock = self.rightblock = Block()
+        self.leftindex = CENTER + 1
+        self.rightindex = CENTER
+        self.length = 0
+        self.state += 1
+    def isEmpty(self):
+        return self.length == 0
+    def size(self):
+        return self.length
+    def append(self, value):
+        if self.maxlen == 0:
+            return
+        if self.rightindex == BLOCKLEN - 1:
+            block = Block()
+            block.left = self.rightblock
+            self.rightblock.right = block
+            self.rightblock = block
+            self.rightindex = -1
+        self.rightindex += 1
+        self.rightblock.data[self.rightindex] = value
+        self.length += 1
+        self.state += 1
+        if self.maxlen is not None and self.length > self.maxlen:
+            self.popleft()
+    def appendleft(self, value):
+        if self.maxlen == 0:
+            return
+        if self.leftindex == 0:
+            block = Block()
+            block.right = self.leftblock
+            self.leftblock.left = block
+            self.leftblock = block
+            self.leftindex = BLOCKLEN
+        self.leftindex -= 1
+        self.leftblock.data[self.leftindex] = value
+        self.length += 1
+        self.state += 1
+        if self.maxlen is not None and self.length > self.maxlen:
+            self.pop()
+    def pop(self):
+        if self.length == 0:
+            raise IndexError('pop from an empty deque')
+        block = self.rightblock
+        value = block.data[self.rightindex]
+        block.data[self.rightindex] = None
+        self.rightindex -= 1
+        self.length -= 1
+        self.state += 1
+        if self.length == 0:
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.rightindex < 0:
+            self.rightblock = block.left
+            self.rightblock.right = None
+            self.rightindex = BLOCKLEN - 1
+        return value
+    def popleft(self):
+        if self.length == 0:
+            raise IndexError('pop from an empty deque')
+        block = self.leftblock
+        value = block.data[self.leftindex]
+        block.data[self.leftindex] = None
+        self.leftindex += 1
+        self.length -= 1
+        self.state += 1
+        if self.length == 0:
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.leftindex == BLOCKLEN:
+            self.leftblock = block.right
+            self.leftblock.left = None
+            self.leftindex = 0
+        return value
+    def extend(self, iterable):
+        append = self.append
+        for value in iterable:
+            append(value)
+    def extendleft(self, iterable):
+        appendleft = self.appendleft
+        for value in iterable:
+            appendleft(value)
+    def rotate(self, n=1):
+        # Move items one at a time between the ends, taking the shorter way
+        # round. Length never changes, so maxlen eviction cannot trigger.
+        length = self.length
+        if length <= 1:
+            return
+        n %= length
+        if n > length // 2:
+            n -= length
+        pop, appendleft = self.pop, self.appendleft
+        while n > 0:
+            appendleft(pop())
+            n -= 1
+        popleft, append = self.popleft, self.append
+        while n < 0:
+            append(popleft())
+            n += 1
+    def __len__(self):
+        return self.length
+    def __bool__(self):
+        return self.length != 0
+    def __iter__(self):
+        return self.islice(0, self.length)
+    def __reversed__(self):
+        block = self.rightblock
+        idx = self.rightindex
+        state = self.state
+        for _ in range(self.length):
+            yield block.data[idx]
+            if self.state != state:
+                raise RuntimeError('deque mutated during iteration')
+            idx -= 1
+            if idx < 0:
+                block = block.left
+                idx = BLOCKLEN - 1
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.length)
+            if step == 1:
+                return Deque(self.islice(start, stop))
+            positions = range(start, stop, step)
+            if len(positions) == 0:
+                return Deque()
+            # Read the covered stretch once, then pick every step-th item
+            lo = min(positions[0], positions[-1])
+            window = list(self.islice(lo, max(positions[0], positions[-1]) + 1))
+            return Deque(window[p - lo] for p in positions)
+        block, idx = self._locate(i)
+        return block.data[idx]
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            raise TypeError('Deque does not support slice assignment')
+        block, idx = self._locate(i)
+        block.data[idx] = value
+    def __repr__(self):
+        if self.maxlen is None:
+            return 'Deque({0!r})'.format(list(self))
+        return 'Deque({0!r}, maxlen={1})'.format(list(self), self.maxlen)
+    def islice(self, start=0, stop=None):
+        # Lazy view over positions [start, stop): walks straight to start and
+        # then reads the blocks in place, nothing is copied
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return
+        block, idx = self._locate(start)
+        state = self.state
+        for _ in range(stop - start):
+            yield block.data[idx]
+            if self.state != state:
+                raise RuntimeError('deque mutated during iteration')
+            idx += 1
+            if idx == BLOCKLEN:
+                block = block.right
+                idx = 0
+    def _locate(self, i):
+        i = operator.index(i)
+        length = self.length
+        if i < 0:
+            i += length
+        if i < 0 or i >= length:
+            raise IndexError('deque index out of range')
+        if i < length // 2:
+            offset = self.leftindex + i
+            block = self.leftblock
+            for _ in range(offset // BLOCKLEN):
+                block = block.right
+            return block, offset % BLOCKLEN
+        offset = (BLOCKLEN - 1 - self.rightindex) + (length - 1 - i)
+        block = self.rightblock
+        for _ in range(offset // BLOCKLEN):
+            block = block.left
+        return block, BLOCKLEN - 1 - offset % BLOCKLEN
 
+if __name__ == '__main__':
+    d = Deque(range(5), maxlen=6)
+    d.appendleft(-1)
+    d.append(5)
+    print(d)
+    d.rotate(2)
+    print(d, d[0], d[-1])
+    print(list(d.islice(1, 4)), d[1:4], d[::-2])
+    while d.isEmpty() == False:
+        print(d.popleft(), end=' ')
+    print()
@@ -26,6 +26,7 @@ class DLList:
         node = Node(val)
         if self.isEmpty() == False:
             node.next = self.head
+            self.head.pre = node
             self.head = node
         else:
             self.head = self.tail = node
@@ -3,54 +3,93 @@
 Created on Sun May 20 14:38:58 2018
 
 @author: ASUS
+
+Names are unique keys: enqueueing a name that is already queued raises
+ValueError, and update() is how a queued item gets a new priority. An updated
+item goes to the back of the line among items of its new priority.
 """
+import heapq
+import itertools
+
+# Entry layout on the heap: [-pri, seq, name, pri]. Priority is negated because
+# heapq is a min-heap and the highest priority has to come out first; seq keeps
+# FIFO order among equal priorities. A removed entry gets name set to REMOVED
+# and is skipped lazily when it reaches the top.
+REMOVED = object()
+
 class PriorityQueue:
-    def __init__(self):
-        self.items = []
-    def enqueue(self, name, pri):
-        if self.size() >= 2:
-            if self.items[len(self.items)-1][1] > pri:
-                self.items.append((name,pri))
-            elif self.items[0][1] < pri:
-                self.items.insert(0,(name,pri))
-            else:
-                for i in range(len(self.items) - 1):
-                    if self.items[i][1]>pri and self.items[i+1][1]<pri:
-                        self.items.insert(i+1,(name,pri))
-                        break
-        elif self.size() == 1:
-            if pri <= self.items[0][1]:
-                self.items.append((name, pri))
-            else:
-                self.items.insert(0, (name, pri))
-        elif self.size() == 0:
-            self.items.append((name, pri))
-            '''
+    def __init__(self, items=None):
+        self.heap = []
+        self.entries = {}
+        self.counter = itertools.count()
+        self.removed = 0
+        if items is not None:
+            self.heapify(items)
+    def heapify(self, items):
+        # Bulk load in O(n): build every entry first, then heapify once.
+        # Names are checked before anything is added, so a clash leaves the
+        # queue untouched.
+        entries = {}
+        for name, pri in items:
+            if name in self.entries or name in entries:
+                raise ValueError('Name {0!r} is already queued'.format(name))
+            entries[name] = [-pri, next(self.counter), name, pri]
+        self.entries.update(entries)
+        self.heap.extend(entries.values())
+        heapq.heapify(self.heap)
     def enqueue(self, name, pri):
-        if self.isEmpty() == True:
-            self.items.append((name, pri))
-        else:
-            i = 0
-            if self.items[len(self.items)-1][1]>pri:
-                self.items.insert(len(self.items), (name, pri))
-            else:
-                while (pri>self.items[i][1]):
-                    i += 1
-                self.items.insert(i, (name, pri))
-                '''
+        if name in self.entries:
+            raise ValueError('Name {0!r} is already queued'.format(name))
+        entry = [-pri, next(self.counter), name, pri]
+        self.entries[name] = entry
+        heapq.heappush(self.heap, entry)
+    def update(self, name, pri):
+        if name not in self.entries:
+            raise KeyError(name)
+        self._discard(name)
+        self.enqueue(name, pri)
+    def remove(self, name):
+        if name not in self.entries:
+            raise KeyError(name)
+        self._discard(name)
+    def contains(self, name):
+        return name in self.entries
     def dequeue(self):
+        self._prune()
         if self.isEmpty():
             print('Nothing to dequeue')
         else:
-            a, b = self.items[0]
-            self.items.remove(self.items[0])
-            return a, b
+            _, _, name, pri = heapq.heappop(self.heap)
+            del self.entries[name]
+            return name, pri
     def isEmpty(self):
-        if len(self.items) == 0:
-            return True
-        else:
-            return False
+        return len(self.entries) == 0
     def size(self):
-        return len(self.items)
+        return len(self.entries)
     def front(self):
-        return self.items[0]
+        self._prune()
+        _, _, name, pri = self.heap[0]
+        return name, pri
+    def _discard(self, name):
+        entry = self.entries.pop(name)
+        entry[2] = REMOVED
+        self.removed += 1
+        # Rebuild once dead entries outnumber live ones so memory stays O(n)
+        if self.removed > len(self.entries):
+            self.heap = [e for e in self.heap if e[2] is not REMOVED]
+            heapq.heapify(self.heap)
+            self.removed = 0
+    def _prune(self):
+        while self.heap and self.heap[0][2] is REMOVED:
+            heapq.heappop(self.heap)
+            self.removed -= 1
+
+if __name__ == '__main__':
+    pq = PriorityQueue([('a', 3), ('b', 1), ('c', 3)])
+    pq.enqueue('d', 2)
+    pq.enqueue('e', 3)
+    pq.update('b', 5)
+    pq.remove('c')
+    print(pq.front())
+    while pq.isEmpty() == False:
+        print(pq.dequeue())
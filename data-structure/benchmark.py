@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:42:55 2026
+
+@author: ASUS
+
+Benchmark and complexity check for every structure in this folder.
+
+Each structure is built at growing sizes n, then each operation is timed
+against it in batches for at least --min-time seconds, the sizes taking
+turns, giving the median seconds per operation at each n. Memory per element
+is taken from tracemalloc while building, with the values to insert created
+beforehand so only the structure itself is counted. Each operation is fitted
+to the closest of the usual complexity classes. It is flagged when the slope
+of log(time per op) against log(n) is clearly above the exponent its
+intended big-O allows, or when the fitted class ranks above the intended one
+and the time also grows by most of an extra log factor beyond it.
+
+Usage: python benchmark.py [--sizes 256 512 1024 2048 4096]
+                           [--min-time 0.2] [--rounds 5] [--seed 0]
+                           [--structures BST Deque ...] [--output results.json]
+"""
+import argparse
+import gc
+import itertools
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from AddressablePriorityQueue import AddressablePriorityQueue
+from BinarySearchTree import BST
+from CircularQueue import CircularQueue
+from Deque import Deque
+from DoubleLinkedList import DLList
+from PriorityQueue import PriorityQueue
+from SingleLinkedList import SLList
+from StackByLinkedList import StackByLinkedList
+
+# Complexity classes, as (per-op growth function, log-log exponent), from
+# best to worst
+MODELS = {
+    '1': (lambda n: 1.0, 0),
+    'log n': (lambda n: math.log(n), 0),
+    'n': (lambda n: float(n), 1),
+    'n log n': (lambda n: n * math.log(n), 1),
+    'n^2': (lambda n: float(n) * n, 2),
+}
+# How far above the intended exponent the measured slope may drift before
+# an operation is flagged, to absorb timer noise and cache effects
+TOLERANCE = 0.5
+# Target length of one timed batch of calls, in seconds
+BATCH_TIME = 0.005
+# When the fitted class ranks above the intended one, the time per op divided
+# by the intended growth must also rise by at least this share of one extra
+# log factor over the measured sizes. Cache misses alone grow slowly with n,
+# so a bare class ranking would flag most O(1) ops as O(log n).
+LOG_TOLERANCE = 0.75
+
+RANK = {name: rank for rank, name in enumerate(MODELS)}
+
+# A builder is prepare(n) -> fill(), where prepare creates the values to insert
+# and fill builds the structure from them, so measureMemory can leave the
+# values out.
+def _filled(cls, method):
+    def prepare(n):
+        values = list(range(n))
+        def fill():
+            obj = cls()
+            add = getattr(obj, method)
+            for v in values:
+                add(v)
+            return obj
+        return fill
+    return prepare
+
+def _filledRandom(cls, method):
+    def prepare(n):
+        values = list(range(n))
+        random.shuffle(values)
+        def fill():
+            obj = cls()
+            add = getattr(obj, method)
+            for v in values:
+                add(v)
+            return obj
+        return fill
+    return prepare
+
+def _filledQueue(cls):
+    def prepare(n):
+        pris = [random.random() for _ in range(n)]
+        def fill():
+            obj = cls()
+            for i, pri in enumerate(pris):
+                obj.enqueue(i, pri)
+            return obj
+        return fill
+    return prepare
+
+# Operations whose bound only holds amortized over a long run. Every batch of
+# them is the full n // 2 calls a structure may take, so the occasional
+# expensive call is spread the way the bound assumes.
+AMORTIZED = {
+    ('AddressablePriorityQueue', 'dequeue'),
+    ('AddressablePriorityQueue', 'remove'),
+    # Lowering a key is a remove + enqueue
+    ('AddressablePriorityQueue', 'update'),
+}
+
+# structure -> (builder, [(operation, intended big-O, op(obj, n, i))])
+# Every op changes the size by at most one per call, so a structure that has
+# taken at most n // 2 calls still holds between n / 2 and 3n / 2 items.
+STRUCTURES = {
+    'BST': (_filledRandom(BST, 'add'), [
+        ('add', 'log n', lambda t, n, i: t.add(random.random() * n)),
+    ]),
+    'SLList': (_filled(SLList, 'addLast'), [
+        ('addFirst', '1', lambda s, n, i: s.addFirst(i)),
+        ('addLast', '1', lambda s, n, i: s.addLast(i)),
+        ('removeFirst', '1', lambda s, n, i: s.removeFirst()),
+        ('removeLast', 'n', lambda s, n, i: s.removeLast()),
+        ('size', 'n', lambda s, n, i: s.size()),
+        ('get', 'n', lambda s, n, i: s.get(n // 2)),
+        ('indexOf', 'n', lambda s, n, i: s.indexOf(n // 2)),
+    ]),
+    'DLList': (_filled(DLList, 'addFirst'), [
+        ('addFirst', '1', lambda d, n, i: d.addFirst(i)),
+    ]),
+    'StackByLinkedList': (_filled(StackByLinkedList, 'push'), [
+        ('push', '1', lambda s, n, i: s.push(i)),
+        ('pop', '1', lambda s, n, i: s.pop()),
+        ('peek', '1', lambda s, n, i: s.peek()),
+    ]),
+    'CircularQueue': (_filled(CircularQueue, 'add'), [
+        ('add', '1', lambda q, n, i: q.add(i)),
+        ('size', 'n', lambda q, n, i: q.size()),
+        ('removeLast', 'n', lambda q, n, i: q.removeLast()),
+    ]),
+    'PriorityQueue': (_filledQueue(PriorityQueue), [
+        ('enqueue', 'log n', lambda q, n, i: q.enqueue(n + i, random.random())),
+        ('dequeue', 'log n', lambda q, n, i: q.dequeue()),
+        ('update', 'log n', lambda q, n, i: q.update(i, random.random())),
+    ]),
+    'AddressablePriorityQueue': (_filledQueue(AddressablePriorityQueue), [
+        ('enqueue', '1', lambda q, n, i: q.enqueue(n + i, random.random())),
+        ('dequeue', 'log n', lambda q, n, i: q.dequeue()),
+        ('update', 'log n', lambda q, n, i: q.update(i, random.random())),
+        ('remove', 'log n', lambda q, n, i: q.remove(i)),
+    ]),
+    'Deque': (_filled(Deque, 'append'), [
+        ('append', '1', lambda d, n, i: d.append(i)),
+        ('appendleft', '1', lambda d, n, i: d.appendleft(i)),
+        ('pop', '1', lambda d, n, i: d.pop()),
+        ('popleft', '1', lambda d, n, i: d.popleft()),
+        ('rotate', '1', lambda d, n, i: d.rotate(1)),
+        ('getitem', 'n', lambda d, n, i: d[n // 2]),
+    ]),
+}
+
+def measureMemory(prepare, n):
+    fill = prepare(n)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = fill()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del obj
+    return (after - before) / n
+
+def _batchTimer(prepare, op, n):
+    # Returns timeBatch(calls). A structure takes at most n // 2 calls and is
+    # then rebuilt, untimed, so its size stays near n.
+    fill = prepare(n)
+    budget = max(n // 2, 1)
+    obj, used = None, budget
+
+    def timeBatch(calls):
+        nonlocal obj, used
+        if used + calls > budget:
+            # Drop the spent structure before building the next one
+            obj = None
+            obj, used = fill(), 0
+        first = used
+        used += calls
+        # The cyclic GC is off while timing, as in timeit: its full
+        # collections walk every live object, which would add a spurious
+        # O(n) term to allocating ops
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for i in range(first, first + calls):
+                op(obj, n, i)
+            return time.perf_counter() - start
+        finally:
+            gc.enable()
+    return timeBatch, budget
+
+def measureOperation(prepare, op, sizes, minTime, rounds, amortized=False):
+    # Seconds per call at each size. Calls are timed in batches whose length
+    # is picked like timeit's autorange (1, 2, 5, 10, ... calls) until a batch
+    # lasts BATCH_TIME or fills the n // 2 budget; a handful of calls of an
+    # O(1) op is far below the timer's jitter. Amortized ops always use the
+    # whole budget.
+    #
+    # The sizes are then measured round-robin, each taking about BATCH_TIME
+    # of batches per pass, until every size has minTime of timed calls over
+    # at least `rounds` batches, and the median per-call time is kept. On a
+    # shared machine the speed drifts over seconds; interleaving spreads a
+    # slow spell over every size instead of inflating whichever size
+    # happened to be running.
+    timers = []
+    for n in sizes:
+        timeBatch, budget = _batchTimer(prepare, op, n)
+        if amortized:
+            calls = budget
+        else:
+            calls = 1
+            for step in itertools.cycle((2, 2.5, 2)):
+                if timeBatch(calls) >= BATCH_TIME or calls == budget:
+                    break
+                calls = min(int(calls * step), budget)
+        timers.append((timeBatch, calls, [], [0.0]))
+    while any(total[0] < minTime or len(perCall) < rounds for _, _, perCall, total in timers):
+        for timeBatch, calls, perCall, total in timers:
+            spent = 0.0
+            while spent < BATCH_TIME:
+                elapsed = timeBatch(calls)
+                spent += elapsed
+                perCall.append(elapsed / calls)
+            total[0] += spent
+    return [statistics.median(perCall) for _, _, perCall, _ in timers]
+
+def loglogSlope(sizes, times):
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in times]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+def fitModel(sizes, times):
+    # Fit log t = log c + log f(n) for each class, i.e. only the constant is
+    # free, and keep the class whose residual is smallest. Classes within 5%
+    # of the best are resolved in favour of the simpler one.
+    best, bestError = None, None
+    for name, (f, _) in MODELS.items():
+        residuals = [math.log(max(t, 1e-12)) - math.log(f(n)) for n, t in zip(sizes, times)]
+        mean = sum(residuals) / len(residuals)
+        error = sum((r - mean) ** 2 for r in residuals)
+        if bestError is None or error < bestError * 0.95:
+            best, bestError = name, error
+    return best
+
+def excessGrowth(sizes, times, expected):
+    # How much log(time / f(n)) grows from the smallest to the largest size
+    # along its least-squares line, for f the intended class
+    f = MODELS[expected][0]
+    ratios = [t / f(n) for n, t in zip(sizes, times)]
+    return loglogSlope(sizes, ratios) * (math.log(sizes[-1]) - math.log(sizes[0]))
+
+def isFlagged(sizes, times, expected, fitted, slope):
+    if slope > MODELS[expected][1] + TOLERANCE:
+        return True
+    # The slope alone cannot tell 1 from log n or n from n log n, so the
+    # fitted class is compared as well
+    logFactor = math.log(math.log(sizes[-1]) / math.log(sizes[0]))
+    return RANK[fitted] > RANK[expected] and excessGrowth(sizes, times, expected) > LOG_TOLERANCE * logFactor
+
+def run(sizes, minTime, rounds, structures=None):
+    results = []
+    for name, (prepare, operations) in STRUCTURES.items():
+        if structures and name not in structures:
+            continue
+        memory = [measureMemory(prepare, n) for n in sizes]
+        for operation, expected, op in operations:
+            times = measureOperation(prepare, op, sizes, minTime, rounds,
+                                     (name, operation) in AMORTIZED)
+            slope = loglogSlope(sizes, times)
+            fitted = fitModel(sizes, times)
+            results.append({
+                'structure': name,
+                'operation': operation,
+                'expected': expected,
+                'fitted': fitted,
+                'slope': round(slope, 3),
+                'flagged': isFlagged(sizes, times, expected, fitted, slope),
+                'amortized': (name, operation) in AMORTIZED,
+                'sizes': sizes,
+                'seconds_per_op': times,
+                'bytes_per_element': memory,
+            })
+            print('{0:>26}.{1:<12} expected O({2}), fitted O({3}), slope {4:.2f}{5}'.format(
+                name, operation, expected, results[-1]['fitted'], slope,
+                '  <-- FLAGGED' if results[-1]['flagged'] else ''), file=sys.stderr)
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    # Small enough that the linked structures stay in cache; past a few
+    # thousand nodes, ops that free and reallocate nodes get slower per node
+    # and O(n) walks start to fit O(n log n)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 512, 1024, 2048, 4096])
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='seconds of timed calls per operation and size')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='minimum number of timed batches per operation and size')
+    parser.add_argument('--structures', nargs='+', choices=sorted(STRUCTURES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args()
+    if min(args.sizes) < 2:
+        parser.error('every size must be at least 2')
+    random.seed(args.seed)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'min_time': args.min_time,
+        'rounds': args.rounds,
+        'results': run(sorted(args.sizes), args.min_time, args.rounds, args.structures),
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
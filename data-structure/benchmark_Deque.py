@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:20:03 2026
+
+@author: ASUS
+
+Throughput of Deque against collections.deque on the same workloads.
+Usage: python benchmark_Deque.py [n]   (n defaults to 1000000)
+"""
+import collections
+import sys
+import time
+
+from Deque import Deque
+
+def append_pop(cls, n):
+    d = cls()
+    for i in range(n):
+        d.append(i)
+    for i in range(n):
+        d.pop()
+
+def appendleft_popleft(cls, n):
+    d = cls()
+    for i in range(n):
+        d.appendleft(i)
+    for i in range(n):
+        d.popleft()
+
+def fifo(cls, n):
+    d = cls()
+    for i in range(n):
+        d.append(i)
+        if i & 1:
+            d.popleft()
+
+def bounded(cls, n):
+    d = cls(maxlen=1000)
+    for i in range(n):
+        d.append(i)
+
+def rotate(cls, n):
+    d = cls(range(1000))
+    for i in range(n // 10):
+        d.rotate(1 if i & 1 else -3)
+
+def iterate(cls, n):
+    d = cls(range(n))
+    start = time.perf_counter()
+    for _ in d:
+        pass
+    return time.perf_counter() - start
+
+WORKLOADS = [append_pop, appendleft_popleft, fifo, bounded, rotate, iterate]
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print('n =', n)
+    print('{0:>20} {1:>12} {2:>12} {3:>8}'.format('workload', 'Deque', 'deque', 'ratio'))
+    for workload in WORKLOADS:
+        timings = []
+        for cls in (Deque, collections.deque):
+            start = time.perf_counter()
+            elapsed = workload(cls, n)
+            if elapsed is None:
+                elapsed = time.perf_counter() - start
+            timings.append(elapsed)
+        print('{0:>20} {1:>11.3f}s {2:>11.3f}s {3:>7.1f}x'.format(
+            workload.__name__, timings[0], timings[1], timings[0] / timings[1]))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:40 2026
+
+@author: ASUS
+
+Compare the heap-based PriorityQueue with the original sorted-list version.
+Usage: python benchmark_PriorityQueue.py [n]   (n defaults to 100000; the
+sorted-list baseline needs a few minutes at that size)
+"""
+import random
+import sys
+import time
+
+from PriorityQueue import PriorityQueue
+
+class ListPriorityQueue:
+    # The original sorted-list implementation, kept here only as a baseline
+    def __init__(self):
+        self.items = []
+    def enqueue(self, name, pri):
+        if self.size() >= 2:
+            if self.items[len(self.items)-1][1] > pri:
+                self.items.append((name,pri))
+            elif self.items[0][1] < pri:
+                self.items.insert(0,(name,pri))
+            else:
+                for i in range(len(self.items) - 1):
+                    if self.items[i][1]>pri and self.items[i+1][1]<pri:
+                        self.items.insert(i+1,(name,pri))
+                        break
+        elif self.size() == 1:
+            if pri <= self.items[0][1]:
+                self.items.append((name, pri))
+            else:
+                self.items.insert(0, (name, pri))
+        elif self.size() == 0:
+            self.items.append((name, pri))
+    def dequeue(self):
+        if self.isEmpty():
+            print('Nothing to dequeue')
+        else:
+            a, b = self.items[0]
+            self.items.remove(self.items[0])
+            return a, b
+    def isEmpty(self):
+        return len(self.items) == 0
+    def size(self):
+        return len(self.items)
+    def front(self):
+        return self.items[0]
+
+def run(queue, data):
+    start = time.perf_counter()
+    for name, pri in data:
+        queue.enqueue(name, pri)
+    enqueued = time.perf_counter()
+    kept = queue.size()
+    while queue.isEmpty() == False:
+        queue.dequeue()
+    dequeued = time.perf_counter()
+    return enqueued - start, dequeued - enqueued, kept
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    random.seed(0)
+    # Distinct random priorities, so the old version's tie-dropping bug does
+    # not hide part of its work
+    data = [(i, pri) for i, pri in enumerate(random.sample(range(n * 10), n))]
+    print('n =', n)
+    for label, queue in (('heap', PriorityQueue()), ('sorted list', ListPriorityQueue())):
+        t_enq, t_deq, kept = run(queue, data)
+        print('{0:>12}: enqueue {1:.3f}s  dequeue {2:.3f}s  kept {3}/{4}'.format(
+            label, t_enq, t_deq, kept, n))
+    start = time.perf_counter()
+    PriorityQueue(data)
+    print('{0:>12}: {1:.3f}s'.format('heapify', time.perf_counter() - start))
@@ -0,0 +1,80 @@
+"""
+Benchmark for cart_split.py.
+
+Times the root split search on a synthetic dataset, exact and binned, on one
+thread and across features, against scikit-learn's depth-1 tree when it is
+installed and against the notebook's Counter-per-split search on a small
+sample.
+
+Usage: python benchmark_cart_split.py [n_rows]   (default 1000000)
+"""
+
+import collections
+import sys
+import time
+
+import numpy as np
+
+from cart_split import find_best_split
+
+
+def cal_gini_impurity(array):
+    # Copied from CART_theory.ipynb as the baseline
+    c = collections.Counter(array)
+    total = sum(c.values())
+    p_classes = [k/total for k in c.values()]
+    gini_impurity = 1 - sum([i**2 for i in p_classes])
+    return gini_impurity
+
+
+def naive_best_split(x, y):
+    # Exhaustive search the way the notebook describes it
+    values = sorted(set(x))
+    best = None
+    for a, b in zip(values[:-1], values[1:]):
+        threshold = (a + b) / 2
+        left = [label for value, label in zip(x, y) if value <= threshold]
+        right = [label for value, label in zip(x, y) if value > threshold]
+        impurity = (len(left) * cal_gini_impurity(left) + len(right) * cal_gini_impurity(right)) / len(y)
+        if best is None or impurity < best[1]:
+            best = (threshold, impurity)
+    return best
+
+
+def make_data(n_rows, n_features=10, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features)).round(3)
+    logits = 1.5 * X[:, 3] - 0.8 * X[:, 7] + rng.normal(scale=0.5, size=n_rows)
+    y = (logits > 0.2).astype(int)
+    return X, y
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f'{label:<40} {time.perf_counter() - start:8.2f}s   {result}')
+    return result
+
+
+if __name__ == '__main__':
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    X, y = make_data(n_rows)
+    print(f'{n_rows} rows x {X.shape[1]} features')
+
+    timed('exact, gini', find_best_split, X, y)
+    timed('exact, entropy', find_best_split, X, y, criterion='entropy')
+    timed('exact, gini, 4 threads', find_best_split, X, y, n_jobs=4)
+    timed('256 bins, gini', find_best_split, X, y, n_bins=256)
+
+    try:
+        from sklearn.tree import DecisionTreeClassifier
+    except ImportError:
+        print('scikit-learn not installed, skipping')
+    else:
+        tree = timed('scikit-learn, depth 1', DecisionTreeClassifier(max_depth=1).fit, X, y)
+        print(f'{"":<40} feature {tree.tree_.feature[0]}, threshold {tree.tree_.threshold[0]:.4f}')
+
+    small = 2_000
+    x_small, y_small = X[:small, 3].tolist(), y[:small].tolist()
+    timed(f'notebook search, 1 feature, {small} rows', naive_best_split, x_small, y_small)
+    timed(f'cart_split, 1 feature, {small} rows', find_best_split, X[:small, 3:4], y[:small])
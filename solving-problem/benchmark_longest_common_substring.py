@@ -0,0 +1,74 @@
+"""
+Benchmark for longest_common_substring.py.
+
+Times the suffix automaton on two 100 KB inputs and in batch mode, and
+compares it with the original notebook implementation on inputs small
+enough for the latter to finish.
+
+Usage: python benchmark_longest_common_substring.py [size_in_bytes]
+"""
+
+import random
+import string
+import sys
+import time
+
+from longest_common_substring import SuffixAutomaton, longest_common_substring
+
+
+def original_find_longest_common_sequence(t1, t2):
+    # Copied from find_longest_common_sequence.ipynb as the baseline
+    sequence = []
+    for i in range(len(t1)):
+        for j in range(len(t2)):
+            j_t = j
+            i_t = i
+            while i_t < len(t1) and j_t < len(t2) and t1[i_t] == t2[j_t]:
+                i_t += 1
+                j_t += 1
+            if i_t != i:
+                sequence.append(t1[i:i_t])
+    sequence = sorted(sequence, key=lambda x: len(x), reverse=True)
+    return sequence[0]
+
+
+def random_log(size, rng):
+    alphabet = string.ascii_lowercase + string.digits + ' :=/'
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+def planted_pair(size, rng, shared=200):
+    # Two random texts sharing one known block at different offsets
+    block = random_log(shared, rng)
+    t1 = random_log(size, rng)
+    t2 = random_log(size, rng)
+    i, j = rng.randrange(size - shared), rng.randrange(size - shared)
+    return t1[:i] + block + t1[i + shared:], t2[:j] + block + t2[j + shared:]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+
+    t1, t2 = planted_pair(size, rng)
+    automaton, build = timed(SuffixAutomaton, t1)
+    (i, j, length), scan = timed(automaton.match, t2)
+    print(f'pair of {size} B: build {build:.2f}s, scan {scan:.2f}s, '
+          f'{len(automaton)} states, match length {length}')
+
+    candidates = [planted_pair(1_000, rng)[0] for _ in range(100)]
+    _, batch = timed(lambda: [automaton.match(c) for c in candidates])
+    print(f'batch of {len(candidates)} x 1 KB against the {size} B index: {batch:.2f}s')
+
+    for small in (100, 200, 400):
+        a, b = planted_pair(small, rng, shared=20)
+        expected, t_orig = timed(original_find_longest_common_sequence, a, b)
+        got, t_new = timed(longest_common_substring, a, b)
+        assert got == expected
+        print(f'{small:>4} B: original {t_orig:.3f}s, automaton {t_new:.4f}s')
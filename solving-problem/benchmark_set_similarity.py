@@ -0,0 +1,88 @@
+"""
+Benchmark for set_similarity.py.
+
+Builds a synthetic corpus with a share of near-duplicate documents, encodes
+it once, then times scoring 1M random pairs in one batch against the
+original per-call functions, and the MinHash + LSH all-pairs search against
+the number of pairs it avoids.
+
+Usage: python benchmark_set_similarity.py [n_docs]   (default 1000000)
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from set_similarity import count_matrix, jaccard_scores, overlap_scores, similar_pairs
+
+
+def original_score2sets(set1, set2):
+    # Copied from score2sets.ipynb as the baseline
+    _AND = set(set1) & set(set2)
+    _OR = set(set1) | set(set2)
+    if len(_OR) >= 1:
+        return len(_AND) / len(_OR)
+    return 1
+
+
+def original_score2lists(list1, list2):
+    # Copied from score2lists.ipynb as the baseline
+    if len(list1) != 0 and len(list2) != 0:
+        if len(list1) > len(list2):
+            max_dim = len(list1)
+            nand = list1.copy()
+            for entry in list2:
+                if entry in nand:
+                    nand.remove(entry)
+        else:
+            max_dim = len(list2)
+            nand = list2.copy()
+            for entry in list1:
+                if entry in nand:
+                    nand.remove(entry)
+        score = 1 - len(nand)/max_dim
+        return score
+    return 0
+
+
+def make_corpus(n_docs, rng, doc_len=20, vocabulary=100_000, duplicate_rate=0.1):
+    docs = []
+    while len(docs) < n_docs:
+        doc = ['t%d' % rng.randrange(vocabulary) for _ in range(doc_len)]
+        docs.append(doc)
+        if rng.random() < duplicate_rate and len(docs) < n_docs:
+            near = doc[:]
+            near[rng.randrange(doc_len)] = 't%d' % rng.randrange(vocabulary)
+            docs.append(near)
+    return docs
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<48} {elapsed:8.2f}s')
+    return result, elapsed
+
+
+if __name__ == '__main__':
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    docs, _ = timed(f'generate {n_docs} documents', make_corpus, n_docs, rng)
+
+    (matrix, _), _ = timed('encode corpus with count_matrix', count_matrix, docs)
+    n_pairs = 1_000_000
+    rows1 = np.array([rng.randrange(n_docs) for _ in range(n_pairs)])
+    rows2 = np.array([rng.randrange(n_docs) for _ in range(n_pairs)])
+    sample = 10_000
+    for name, original, batched in (('score2sets', original_score2sets, jaccard_scores),
+                                     ('score2lists', original_score2lists, overlap_scores)):
+        _, t_orig = timed(f'{name}, original, {sample} random pairs',
+                          lambda: [original(docs[i], docs[j]) for i, j in zip(rows1[:sample], rows2[:sample])])
+        timed(f'{name}, batched, {n_pairs} random pairs', batched, matrix, rows1, rows2)
+        print(f'{"":<48} original extrapolated to {n_pairs} pairs: {t_orig * n_pairs / sample:.2f}s')
+
+    (pairs, scores), _ = timed(f'MinHash + LSH, all pairs with Jaccard >= 0.8', similar_pairs, docs, 0.8)
+    print(f'{"":<48} {len(pairs)} pairs found, {n_docs * (n_docs - 1) // 2} pairs in total')
@@ -0,0 +1,171 @@
+"""
+Longest Common Substring
+
+Linear-time replacement for ``find_longest_common_sequence`` in
+find_longest_common_sequence.ipynb. A suffix automaton is built over one
+sequence in O(n) and any other sequence is then scanned against it in O(m),
+so one query can be compared with many candidates while paying for the index
+only once.
+
+Inputs can be strings or any sequence of hashable items, e.g. lists of
+tokens when diffing log lines word by word.
+"""
+
+from typing import Hashable, Iterable, List, Sequence, Tuple
+
+
+class SuffixAutomaton:
+    """
+    Suffix automaton (DAWG) of a sequence.
+
+    Parameters:
+    -----------
+    text : sequence
+        String or sequence of hashable items to index
+
+    Notes:
+    ------
+    States are kept in parallel lists rather than node objects: ``link`` is
+    the suffix link, ``length`` the longest substring ending in the state,
+    ``first_end`` the end position of its first occurrence in ``text`` and
+    ``transitions`` a dict per state. There are at most 2n states.
+    """
+
+    def __init__(self, text: Sequence[Hashable]):
+        self.text = text
+        self.link = [-1]
+        self.length = [0]
+        self.first_end = [-1]
+        self.transitions = [{}]
+
+        link, length, first_end, transitions = self.link, self.length, self.first_end, self.transitions
+        last = 0
+        for pos, item in enumerate(text):
+            cur = len(length)
+            length.append(length[last] + 1)
+            link.append(0)
+            first_end.append(pos)
+            transitions.append({})
+
+            p = last
+            while p != -1 and item not in transitions[p]:
+                transitions[p][item] = cur
+                p = link[p]
+            if p != -1:
+                q = transitions[p][item]
+                if length[p] + 1 == length[q]:
+                    link[cur] = q
+                else:
+                    clone = len(length)
+                    length.append(length[p] + 1)
+                    link.append(link[q])
+                    first_end.append(first_end[q])
+                    transitions.append(dict(transitions[q]))
+                    while p != -1 and transitions[p].get(item) == q:
+                        transitions[p][item] = clone
+                        p = link[p]
+                    link[q] = link[cur] = clone
+            last = cur
+
+    def __len__(self) -> int:
+        return len(self.length)
+
+    def match(self, other: Sequence[Hashable]) -> Tuple[int, int, int]:
+        """
+        Locate the longest common substring of the indexed text and ``other``.
+
+        Parameters:
+        -----------
+        other : sequence
+            Sequence to scan against the index
+
+        Returns:
+        --------
+        tuple of int
+            (start in text, start in other, length). Among equally long
+            matches the one starting earliest in ``text`` wins. Length is 0
+            when nothing is shared.
+        """
+        link, length, first_end, transitions = self.link, self.length, self.first_end, self.transitions
+        best_len, best_i, best_j = 0, 0, 0
+        state, cur_len = 0, 0
+        for j, item in enumerate(other):
+            if item in transitions[state]:
+                state = transitions[state][item]
+                cur_len += 1
+            else:
+                while state != -1 and item not in transitions[state]:
+                    state = link[state]
+                if state == -1:
+                    state, cur_len = 0, 0
+                    continue
+                cur_len = length[state] + 1
+                state = transitions[state][item]
+            if cur_len >= best_len:
+                start = first_end[state] - cur_len + 1
+                if cur_len > best_len or start < best_i:
+                    best_len, best_i, best_j = cur_len, start, j - cur_len + 1
+        return best_i, best_j, best_len
+
+    def longest_common_substring(self, other: Sequence[Hashable]) -> Sequence[Hashable]:
+        """
+        Longest common substring of the indexed text and ``other``.
+
+        Returns:
+        --------
+        sequence
+            Slice of the indexed text; empty when nothing is shared
+        """
+        start, _, size = self.match(other)
+        return self.text[start:start + size]
+
+
+def longest_common_substring(t1: Sequence[Hashable], t2: Sequence[Hashable]) -> Sequence[Hashable]:
+    """
+    Longest common substring of two sequences in O(len(t1) + len(t2)).
+
+    Parameters:
+    -----------
+    t1, t2 : sequence
+        Strings or sequences of hashable items
+
+    Returns:
+    --------
+    sequence
+        Slice of ``t1``; the earliest one in ``t1`` on ties, empty when the
+        inputs share nothing
+    """
+    return SuffixAutomaton(t1).longest_common_substring(t2)
+
+
+def batch_longest_common_substring(query: Sequence[Hashable],
+                                   candidates: Iterable[Sequence[Hashable]]) -> List[Sequence[Hashable]]:
+    """
+    Longest common substring of one query against many candidates.
+
+    The query is indexed once, so each candidate only costs a linear scan.
+
+    Parameters:
+    -----------
+    query : sequence
+        Sequence shared by every comparison
+    candidates : iterable of sequences
+        Sequences to compare with ``query``
+
+    Returns:
+    --------
+    list
+        One slice of ``query`` per candidate, in order
+    """
+    automaton = SuffixAutomaton(query)
+    return [automaton.longest_common_substring(candidate) for candidate in candidates]
+
+
+def find_longest_common_sequence(t1: Sequence[Hashable], t2: Sequence[Hashable]) -> Sequence[Hashable]:
+    """
+    Drop-in for the notebook function of the same name.
+
+    Unlike the original it returns an empty slice instead of raising
+    IndexError when ``t1`` and ``t2`` share nothing.
+    """
+    return longest_common_substring(t1, t2)
@@ -0,0 +1,230 @@
+"""
+Parenthesis Structure Clustering
+
+Scalable version of ``analyze_parenthese_structure`` from
+extract_parentheses_structure.ipynb. The notebook compares every pair of
+logs with ``compare_2tree_structure`` and fills a dense n x n matrix. That
+comparison is exact equality of the (level, branches) tree summaries, so
+here each log is reduced once to a hashable signature and logs are grouped
+through a dictionary keyed by it: O(n) work and memory instead of O(n^2).
+Parsing runs on a process pool, and the result is a set of clusters rather
+than a matrix.
+
+The parsing helpers are the notebook's, unchanged apart from ``remove_len``
+comparing strings with ``!=`` instead of ``is not``.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+Signature = Tuple[Tuple[int, int], ...]
+
+
+def parse_parenthesis(expr):
+    def _helper(iter, pre_type):
+        items = []
+        for item in iter:
+            if item == '(':
+                result = _helper(iter, '(')
+                items.append(result)
+            elif item == '[':
+                result = _helper(iter, '[')
+                items.append(result)
+            elif item == '{':
+                result = _helper(iter, '{')
+                items.append(result)
+            elif pre_type == '(' and item == ')':
+                return items
+            elif pre_type == '[' and item == ']':
+                return items
+            elif pre_type == '{' and item == '}':
+                return items
+            else:
+                items.append(item)
+        return items
+    return _helper(iter(expr), None)
+
+
+def concate(items):
+    content = ''
+    replacement = []
+    for item in items:
+        if type(item) is str:
+            content += item
+        if type(item) is list:
+            replacement.append(content.strip())
+            replacement.append(concate(item))
+            content = ''
+    replacement.append(content.strip())
+    return replacement
+
+
+def remove_len(items):
+    temp = []
+    for item in items:
+        if type(item) is str:
+            if item != "":
+                temp.append(item)
+        if type(item) is list:
+            l = remove_len(item)
+            if len(l) >= 1:
+                temp.append(l)
+    return temp
+
+
+def parse_tree_structure(items):
+    level_numbranches_mapping = {}
+    recursions = []
+
+    def scan_exhaustive(level, items):
+        num_branches = 0
+        for item in items:
+            if type(item) == list:
+                num_branches += 1
+                scan_exhaustive(level + 1, item)
+        recursions.append((level, num_branches))
+        return level, num_branches
+    scan_exhaustive(0, items)
+    for recursion in recursions:
+        level_numbranches_mapping[recursion[0]] = level_numbranches_mapping.get(recursion[0], 0) + recursion[1]
+    level_numbranches_mapping = sorted(level_numbranches_mapping.items(), key=lambda x: x[0])
+    return level_numbranches_mapping
+
+
+def compare_2tree_structure(tree1, tree2):
+    if len(tree1) == len(tree2):
+        for idx, (level, num_branches) in enumerate(tree1):
+            if tree2[idx][0] != level or tree2[idx][1] != num_branches:
+                return 0
+        return 1
+    return 0
+
+
+def structure_signature(text: str) -> Signature:
+    """
+    Canonical, hashable form of a log's parenthesis tree structure.
+
+    Two logs get the same signature exactly when ``compare_2tree_structure``
+    scores their trees 1.
+
+    Parameters:
+    -----------
+    text : str
+        Raw error log
+
+    Returns:
+    --------
+    tuple
+        The sorted (level, number of branches) pairs as a tuple
+    """
+    return tuple(parse_tree_structure(remove_len(concate(parse_parenthesis(text)))))
+
+
+def compute_signatures(raw_error_logs: Iterable[str], processes: Optional[int] = None,
+                       chunksize: int = 1000) -> List[Signature]:
+    """
+    Signatures of many logs, parsed across a process pool.
+
+    Parameters:
+    -----------
+    raw_error_logs : iterable of str
+        Logs to parse
+    processes : int, optional
+        Worker processes; None uses every CPU and 1 parses in this process
+    chunksize : int, default 1000
+        Logs sent to a worker per task, large enough to amortize pickling
+
+    Returns:
+    --------
+    list of tuple
+        One signature per log, in input order
+    """
+    if processes == 1:
+        return [structure_signature(text) for text in raw_error_logs]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(structure_signature, raw_error_logs, chunksize=chunksize))
+
+
+def cluster_parenthese_structure(raw_error_logs: Iterable[str], processes: Optional[int] = None,
+                                 chunksize: int = 1000,
+                                 compare: Optional[Callable[[Signature, Signature], float]] = None,
+                                 threshold: float = 1.0) -> Dict[Signature, List[int]]:
+    """
+    Group logs whose parenthesis structures match.
+
+    Parameters:
+    -----------
+    raw_error_logs : iterable of str
+        Logs to cluster; document ids are their positions
+    processes : int, optional
+        Worker processes used for parsing, see ``compute_signatures``
+    chunksize : int, default 1000
+        Logs sent to a worker per task
+    compare : callable, optional
+        Looser similarity between two signatures. Only needed for fuzzy
+        matching: it is run on pairs of distinct signatures, never on
+        pairs of logs, and groups scoring at least ``threshold`` are merged.
+    threshold : float, default 1.0
+        Minimum ``compare`` score for two groups to be merged
+
+    Returns:
+    --------
+    dict
+        Signature -> ids of the logs in that cluster. After merging, the
+        key is the signature of the cluster's first log.
+    """
+    clusters = {}
+    for doc_id, signature in enumerate(compute_signatures(raw_error_logs, processes, chunksize)):
+        clusters.setdefault(signature, []).append(doc_id)
+    if compare is None or len(clusters) < 2:
+        return clusters
+
+    # Union-find over the distinct signatures only
+    signatures = list(clusters)
+    parent = list(range(len(signatures)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(signatures)):
+        for j in range(i + 1, len(signatures)):
+            if find(i) != find(j) and compare(signatures[i], signatures[j]) >= threshold:
+                parent[find(j)] = find(i)
+
+    # Signatures are in order of first appearance, so the first one in each
+    # group is the signature of the group's first log
+    merged = {}
+    for i, signature in enumerate(signatures):
+        merged.setdefault(find(i), []).append(signature)
+    return {group[0]: sorted(doc_id for signature in group for doc_id in clusters[signature])
+            for group in merged.values()}
+
+
+def cluster_labels(clusters: Dict[Signature, List[int]], n: int) -> List[int]:
+    """
+    Flatten clusters into one label per log.
+
+    ``labels[i] == labels[j]`` reproduces entry (i, j) of the notebook's
+    dense similarity matrix without storing it.
+
+    Parameters:
+    -----------
+    clusters : dict
+        Output of ``cluster_parenthese_structure``
+    n : int
+        Number of logs that were clustered
+
+    Returns:
+    --------
+    list of int
+        Cluster index per log, numbered by first appearance
+    """
+    labels = [-1] * n
+    ordered = sorted(clusters.values(), key=lambda doc_ids: doc_ids[0])
+    for label, doc_ids in enumerate(ordered):
+        for doc_id in doc_ids:
+            labels[doc_id] = label
+    return labels
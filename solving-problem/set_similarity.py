@@ -0,0 +1,431 @@
+"""
+Set Similarity
+
+Batched versions of ``score2sets`` (Jaccard, score2sets.ipynb) and
+``score2lists`` (multiset overlap, score2lists.ipynb), plus MinHash + LSH for
+finding every pair of documents above a Jaccard threshold without scoring
+all n^2 pairs.
+
+Documents are iterables of hashable tokens. A corpus is encoded once by
+``count_matrix`` into a sparse document x token count matrix, and every
+score is then computed from it with sparse matrix operations, for as many
+pairs as needed in one call:
+
+    score2sets   |A & B| / |A | B|                      (1 when both empty)
+    score2lists  |A & B| / max(|A|, |B|) as multisets   (0 when either empty)
+"""
+
+import hashlib
+from collections import Counter, defaultdict
+from itertools import chain, count
+from typing import Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+def score2sets(set1: Iterable[Hashable], set2: Iterable[Hashable]) -> float:
+    """
+    Jaccard similarity of two collections, as in score2sets.ipynb.
+    """
+    set1, set2 = set(set1), set(set2)
+    union = len(set1 | set2)
+    if union >= 1:
+        return len(set1 & set2) / union
+    return 1
+
+
+def score2lists(list1: Sequence[Hashable], list2: Sequence[Hashable]) -> float:
+    """
+    Multiset overlap of two lists, as in score2lists.ipynb.
+
+    Counts the common elements with a Counter intersection in O(n + m)
+    instead of calling ``list.remove`` once per element.
+    """
+    if len(list1) != 0 and len(list2) != 0:
+        common = sum((Counter(list1) & Counter(list2)).values())
+        return common / max(len(list1), len(list2))
+    return 0
+
+
+def count_matrix(docs: Iterable[Iterable[Hashable]],
+                 vocabulary: Optional[Dict[Hashable, int]] = None) -> Tuple[sparse.csr_matrix, Dict[Hashable, int]]:
+    """
+    Sparse document x token count matrix.
+
+    Parameters:
+    -----------
+    docs : iterable of iterables
+        Token collections
+    vocabulary : dict, optional
+        Token -> column mapping to start from; pass the one returned for
+        another corpus to put both in the same column space
+
+    Returns:
+    --------
+    tuple
+        (CSR count matrix with sorted, de-duplicated columns per row,
+        vocabulary)
+    """
+    # A defaultdict whose factory is a counter hands out the next column the
+    # first time a token is seen, so each token costs one C-level lookup
+    vocabulary = defaultdict(count(len(vocabulary or ())).__next__, vocabulary or {})
+    docs = [doc if hasattr(doc, '__len__') else list(doc) for doc in docs]
+    indptr = np.zeros(len(docs) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, docs), dtype=np.int64, count=len(docs)), out=indptr[1:])
+    indices = np.fromiter(map(vocabulary.__getitem__, chain.from_iterable(docs)),
+                          dtype=np.int64, count=int(indptr[-1]))
+    data = np.ones(len(indices), dtype=np.int64)
+    matrix = sparse.csr_matrix((data, indices, indptr), shape=(len(docs), max(len(vocabulary), 1)))
+    matrix.sum_duplicates()
+    return matrix, dict(vocabulary)
+
+
+def jaccard_scores(matrix: sparse.csr_matrix, rows1: np.ndarray, rows2: np.ndarray) -> np.ndarray:
+    """
+    ``score2sets`` for many pairs of rows of an encoded corpus at once.
+
+    Parameters:
+    -----------
+    matrix : scipy.sparse.csr_matrix
+        Output of ``count_matrix``
+    rows1, rows2 : array-like of int
+        Row ids of the pairs to score
+
+    Returns:
+    --------
+    numpy.ndarray
+        One Jaccard score per pair
+    """
+    rows1, rows2 = np.asarray(rows1), np.asarray(rows2)
+    common = matrix[rows1].multiply(matrix[rows2]).getnnz(axis=1).astype(float)
+    sizes = np.diff(matrix.indptr)
+    union = sizes[rows1] + sizes[rows2] - common
+    return np.divide(common, union, out=np.ones_like(common), where=union > 0)
+
+
+def overlap_scores(matrix: sparse.csr_matrix, rows1: np.ndarray, rows2: np.ndarray) -> np.ndarray:
+    """
+    ``score2lists`` for many pairs of rows of an encoded corpus at once.
+
+    Parameters:
+    -----------
+    matrix : scipy.sparse.csr_matrix
+        Output of ``count_matrix``
+    rows1, rows2 : array-like of int
+        Row ids of the pairs to score
+
+    Returns:
+    --------
+    numpy.ndarray
+        One multiset overlap score per pair
+    """
+    rows1, rows2 = np.asarray(rows1), np.asarray(rows2)
+    common = np.asarray(matrix[rows1].minimum(matrix[rows2]).sum(axis=1), dtype=float).ravel()
+    lengths = np.asarray(matrix.sum(axis=1)).ravel()
+    longest = np.maximum(lengths[rows1], lengths[rows2])
+    return np.divide(common, longest, out=np.zeros_like(common), where=longest > 0)
+
+
+def _stacked(docs1, docs2):
+    docs1, docs2 = list(docs1), list(docs2)
+    if len(docs1) != len(docs2):
+        raise ValueError('docs1 and docs2 must have the same length')
+    matrix, _ = count_matrix(docs1 + docs2)
+    rows = np.arange(len(docs1))
+    return matrix, rows, rows + len(docs1)
+
+
+def paired_jaccard(docs1: Iterable[Iterable[Hashable]], docs2: Iterable[Iterable[Hashable]]) -> np.ndarray:
+    """
+    ``score2sets(docs1[i], docs2[i])`` for every i in one batch.
+
+    Returns:
+    --------
+    numpy.ndarray
+        One Jaccard score per pair
+    """
+    return jaccard_scores(*_stacked(docs1, docs2))
+
+
+def paired_overlap(lists1: Iterable[Sequence[Hashable]], lists2: Iterable[Sequence[Hashable]]) -> np.ndarray:
+    """
+    ``score2lists(lists1[i], lists2[i])`` for every i in one batch.
+
+    Returns:
+    --------
+    numpy.ndarray
+        One multiset overlap score per pair
+    """
+    return overlap_scores(*_stacked(lists1, lists2))
+
+
+def _upper_scores(common: sparse.spmatrix, denominator, threshold: float) -> sparse.csr_matrix:
+    common = sparse.triu(common, k=1).tocoo()
+    scores = common.data / denominator(common.row, common.col, common.data)
+    keep = scores >= threshold
+    return sparse.csr_matrix((scores[keep], (common.row[keep], common.col[keep])), shape=common.shape)
+
+
+def _expand_counts(matrix: sparse.csr_matrix) -> sparse.csr_matrix:
+    # A token seen c times becomes c binary features (token, 1) .. (token, c),
+    # so the dot product of two expanded rows is sum(min(a_t, b_t))
+    coo = matrix.tocoo()
+    counts = coo.data
+    rows = np.repeat(coo.row, counts)
+    cols = np.repeat(coo.col, counts)
+    occurrence = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    _, features = np.unique(cols * int(counts.max(initial=1)) + occurrence, return_inverse=True)
+    return sparse.csr_matrix((np.ones(len(rows), dtype=np.int64), (rows, features.ravel())),
+                             shape=(matrix.shape[0], max(int(features.max(initial=0)) + 1, 1)))
+
+
+def pairwise_jaccard(docs: Iterable[Iterable[Hashable]], threshold: float = 0.0) -> sparse.csr_matrix:
+    """
+    Jaccard similarity of every pair of documents that share a token.
+
+    Intersections come from one sparse product of the binary matrix with its
+    transpose, so pairs with nothing in common cost nothing.
+
+    Parameters:
+    -----------
+    docs : iterable of iterables
+        Token collections
+    threshold : float, default 0.0
+        Drop pairs scoring below this
+
+    Returns:
+    --------
+    scipy.sparse.csr_matrix
+        Upper-triangular matrix holding the score of each pair (i, j), i < j.
+        Pairs sharing nothing are left out.
+    """
+    matrix, _ = count_matrix(docs)
+    binary = (matrix > 0).astype(np.int64)
+    sizes = np.diff(binary.indptr)
+    return _upper_scores(binary @ binary.T, lambda i, j, common: sizes[i] + sizes[j] - common, threshold)
+
+
+def pairwise_overlap(lists: Iterable[Sequence[Hashable]], threshold: float = 0.0) -> sparse.csr_matrix:
+    """
+    ``score2lists`` of every pair of lists that share an element.
+
+    Parameters:
+    -----------
+    lists : iterable of sequences
+        Token lists; repeated tokens count as in a multiset
+    threshold : float, default 0.0
+        Drop pairs scoring below this
+
+    Returns:
+    --------
+    scipy.sparse.csr_matrix
+        Upper-triangular matrix holding the score of each pair (i, j), i < j.
+        Pairs sharing nothing are left out.
+    """
+    matrix, _ = count_matrix(lists)
+    lengths = np.asarray(matrix.sum(axis=1)).ravel()
+    expanded = _expand_counts(matrix)
+    return _upper_scores(expanded @ expanded.T,
+                         lambda i, j, common: np.maximum(lengths[i], lengths[j]), threshold)
+
+
+def _token_hashes(vocabulary: Dict[Hashable, int]) -> np.ndarray:
+    # 64-bit blake2b of the token's repr: stable across processes and
+    # corpora, unlike hash(), wide enough that a million-token vocabulary
+    # does not collide, and repr keeps 1 and '1' apart. Computed once per
+    # distinct token.
+    hashes = np.empty(len(vocabulary), dtype=np.uint64)
+    for token, column in vocabulary.items():
+        digest = hashlib.blake2b(repr(token).encode('utf-8'), digest_size=8).digest()
+        hashes[column] = int.from_bytes(digest, 'little')
+    return hashes
+
+
+def minhash_signatures(docs: Iterable[Iterable[Hashable]], num_perm: int = 128, seed: int = 0,
+                       chunk_tokens: int = 2_000) -> np.ndarray:
+    """
+    MinHash signatures of a corpus.
+
+    Uses the universal hashes h(x) = (a * x_hi + c * x_lo + b) mod (2^31 - 1)
+    over 64-bit token hashes split into two 31-bit halves, so two distinct
+    tokens only share every permutation's value when their hashes agree on
+    62 bits. Each distinct token is hashed once into a
+    (vocabulary x num_perm) table, about 4 * num_perm bytes per token; the
+    documents are then processed in chunks of about ``chunk_tokens`` tokens,
+    each one a row gather followed by a ``minimum.reduceat`` over document
+    boundaries.
+
+    Parameters:
+    -----------
+    docs : iterable of iterables
+        Token collections; duplicates within a document are ignored
+    num_perm : int, default 128
+        Signature length; the estimate's standard error is about
+        1 / sqrt(num_perm)
+    seed : int, default 0
+        Seed for the hash coefficients; compare only signatures built with
+        the same seed and ``num_perm``
+    chunk_tokens : int, default 2000
+        Tokens gathered per chunk. The working set, about
+        4 * num_perm * chunk_tokens bytes, should stay cache-sized
+
+    Returns:
+    --------
+    numpy.ndarray
+        (n_docs, num_perm) uint32 signatures. Empty documents get the
+        maximum value in every position.
+    """
+    matrix, vocabulary = count_matrix(docs)
+    return _minhash(matrix, vocabulary, num_perm, seed, chunk_tokens)
+
+
+def _minhash(matrix: sparse.csr_matrix, vocabulary: Dict[Hashable, int], num_perm: int, seed: int,
+             chunk_tokens: int) -> np.ndarray:
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.int64).astype(np.uint64)
+    c = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.int64).astype(np.uint64)
+
+    # Every distinct token is hashed once per permutation. With a, c, b and
+    # both halves of the token hash at most 2^31 - 1, a * x_hi + c * x_lo + b
+    # stays below 2^63, and x mod p is taken by folding the high bits onto
+    # the low ones instead of using %. The result may be p itself, which
+    # just stands for 0.
+    hashes = _token_hashes(vocabulary)
+    values = ((hashes >> np.uint64(32)) & _MERSENNE_PRIME)[:, None] * a
+    values += (hashes & _MERSENNE_PRIME)[:, None] * c
+    values += b
+    for _ in range(3):
+        high = values >> np.uint64(31)
+        values &= _MERSENNE_PRIME
+        values += high
+    values = values.astype(np.uint32)
+
+    # Documents then only gather their tokens' rows and take column minima
+    n = matrix.shape[0]
+    indptr = matrix.indptr
+    signatures = np.full((n, num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    start = 0
+    while start < n:
+        stop = int(np.searchsorted(indptr, indptr[start] + chunk_tokens, side='right')) - 1
+        stop = min(max(stop, start + 1), n)
+        nonempty = np.arange(start, stop)[indptr[start:stop] < indptr[start + 1:stop + 1]]
+        if len(nonempty):
+            lo, hi = indptr[start], indptr[stop]
+            signatures[nonempty] = np.minimum.reduceat(values[matrix.indices[lo:hi]],
+                                                       indptr[nonempty] - lo, axis=0)
+        start = stop
+    return signatures
+
+
+def lsh_params(threshold: float, num_perm: int, recall: float = 0.95) -> Tuple[int, int]:
+    """
+    Bands and rows per band for a Jaccard threshold.
+
+    Two documents with similarity s share at least one band with
+    probability 1 - (1 - s^rows)^bands. The most selective split (most
+    rows per band, so fewest false candidates) that still catches a pair
+    sitting exactly at ``threshold`` with probability ``recall`` is chosen.
+
+    Returns:
+    --------
+    tuple of int
+        (bands, rows) with bands * rows <= num_perm
+    """
+    for rows in range(num_perm, 0, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            return bands, rows
+    return num_perm, 1
+
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int, rows: int) -> np.ndarray:
+    """
+    Pairs of documents that agree on every row of at least one band.
+
+    Parameters:
+    -----------
+    signatures : numpy.ndarray
+        Output of ``minhash_signatures``
+    bands, rows : int
+        Banding, see ``lsh_params``
+
+    Returns:
+    --------
+    numpy.ndarray
+        (k, 2) int64 array of distinct pairs (i, j) with i < j
+    """
+    n = signatures.shape[0]
+    # Odd 64-bit multipliers folding a band's rows into one key; collisions
+    # only add candidates, which are scored afterwards anyway
+    multipliers = (np.random.RandomState(rows).randint(0, 1 << 62, size=rows, dtype=np.int64)
+                   .astype(np.uint64) * np.uint64(2) + np.uint64(1))
+    found = []
+    for band in range(bands):
+        band_rows = signatures[:, band * rows:(band + 1) * rows].astype(np.uint64)
+        keys = (band_rows * multipliers).sum(axis=1, dtype=np.uint64)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sizes = np.diff(np.r_[starts, n])
+        # Buckets of two are by far the most common, so they are paired in
+        # one vectorized step; larger buckets get every pair inside them
+        twos = starts[sizes == 2]
+        found.append(np.stack([order[twos], order[twos + 1]], axis=1))
+        for start, size in zip(starts[sizes > 2], sizes[sizes > 2]):
+            group = order[start:start + size]
+            i, j = np.triu_indices(size, k=1)
+            found.append(np.stack([group[i], group[j]], axis=1))
+    if n == 0:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.sort(np.concatenate(found), axis=1).astype(np.int64)
+    # Encode each pair as one integer so de-duplication is a flat np.unique
+    codes = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.stack([codes // n, codes % n], axis=1)
+
+
+def similar_pairs(docs: Iterable[Iterable[Hashable]], threshold: float = 0.5, num_perm: int = 128,
+                  seed: int = 0, exact: bool = True, recall: float = 0.95) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All pairs of documents with Jaccard similarity of at least ``threshold``,
+    found through MinHash + LSH instead of scoring every pair.
+
+    Recall is probabilistic: a pair right at the threshold is found with
+    probability ``recall``, pairs further above it more often. Empty
+    documents are skipped.
+
+    Parameters:
+    -----------
+    docs : iterable of iterables
+        Token collections
+    threshold : float, default 0.5
+        Minimum Jaccard similarity
+    num_perm : int, default 128
+        MinHash signature length
+    seed : int, default 0
+        Seed for the hash coefficients
+    exact : bool, default True
+        Score candidates exactly from the documents; otherwise use the
+        MinHash estimate, which is cheaper but noisy
+    recall : float, default 0.95
+        Target chance of finding a pair at the threshold, see ``lsh_params``
+
+    Returns:
+    --------
+    tuple of numpy.ndarray
+        (pairs, scores): (k, 2) document ids with i < j and their scores
+    """
+    matrix, vocabulary = count_matrix(docs)
+    signatures = _minhash(matrix, vocabulary, num_perm, seed, chunk_tokens=2_000)
+    nonempty = np.flatnonzero(signatures[:, 0] != np.iinfo(signatures.dtype).max)
+    bands, rows = lsh_params(threshold, num_perm, recall)
+    pairs = nonempty[lsh_candidate_pairs(signatures[nonempty], bands, rows)]
+    if exact:
+        scores = jaccard_scores(matrix, pairs[:, 0], pairs[:, 1])
+    else:
+        scores = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+    keep = scores >= threshold
+    return pairs[keep], scores[keep]
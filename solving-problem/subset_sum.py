@@ -0,0 +1,314 @@
+"""
+Subset Sum
+
+Pseudo-polynomial replacement for ``find``, ``find_2_target`` and
+``twoSubsequences`` in find_subsequence_equal_target.ipynb. The notebook
+enumerates subsets by recursion, copying ``r_arr[i+1:]`` on every call, so
+it is exponential in the array length. Here subsets are counted with a
+dynamic-programming table over sums, built one array element at a time with
+vectorized NumPy row updates: O(n * target) for plain counts and
+O(n^2 * target) when counts are split by subset size. Actual subsets are
+only produced on demand, walking the table backwards as a generator.
+
+Values must be non-negative integers. Subsets are counted by position, so
+repeated values give distinct subsets, and the empty subset counts for a
+target of 0.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+def _as_values(values: Iterable[int]) -> np.ndarray:
+    values = np.asarray(list(values), dtype=np.int64)
+    if values.size and values.min() < 0:
+        raise ValueError('values must be non-negative integers')
+    return values
+
+
+def _empty_counts(shape, modulo: Optional[int]) -> np.ndarray:
+    # Exact counts overflow int64 quickly, so they are kept as Python ints
+    # unless the caller asks for them modulo something
+    if modulo is None:
+        counts = np.zeros(shape, dtype=object)
+        counts[...] = 0
+        return counts
+    return np.zeros(shape, dtype=np.int64)
+
+
+def count_subsets(values: Iterable[int], target: int, modulo: Optional[int] = None) -> int:
+    """
+    Number of subsets of ``values`` summing to ``target``.
+
+    Parameters:
+    -----------
+    values : iterable of int
+        Non-negative integers
+    target : int
+        Required sum
+    modulo : int, optional
+        Reduce counts modulo this number, keeping them in int64
+
+    Returns:
+    --------
+    int
+        Subset count, modulo ``modulo`` if given
+    """
+    if target < 0:
+        return 0
+    counts = _empty_counts(target + 1, modulo)
+    counts[0] = 1
+    for v in _as_values(values):
+        if v > target:
+            continue
+        # The right-hand side is evaluated before assigning, so each value
+        # is used at most once per subset
+        counts[v:] = counts[v:] + counts[:target + 1 - v]
+        if modulo is not None:
+            counts[v:] %= modulo
+    return int(counts[target])
+
+
+def count_subsets_by_size(values: Iterable[int], target: int,
+                          modulo: Optional[int] = None) -> np.ndarray:
+    """
+    Subset counts split by subset size.
+
+    Parameters:
+    -----------
+    values : iterable of int
+        Non-negative integers
+    target : int
+        Largest sum to track
+    modulo : int, optional
+        Reduce counts modulo this number, keeping them in int64
+
+    Returns:
+    --------
+    numpy.ndarray
+        ``counts[k, s]`` is the number of k-element subsets summing to s,
+        for 0 <= k <= len(values) and 0 <= s <= target
+    """
+    values = _as_values(values)
+    counts = _empty_counts((len(values) + 1, target + 1), modulo)
+    counts[0, 0] = 1
+    for i, v in enumerate(values):
+        if v > target:
+            continue
+        # After i elements only sizes up to i can be non-zero
+        counts[1:i + 2, v:] = counts[1:i + 2, v:] + counts[:i + 1, :target + 1 - v]
+        if modulo is not None:
+            counts[1:i + 2, v:] %= modulo
+    return counts
+
+
+def subset_table(values: Iterable[int], target: int, size: Optional[int] = None) -> np.ndarray:
+    """
+    Reachability table used to enumerate subsets.
+
+    Parameters:
+    -----------
+    values : iterable of int
+        Non-negative integers
+    target : int
+        Largest sum to track
+    size : int, optional
+        Also track subset sizes up to this bound
+
+    Returns:
+    --------
+    numpy.ndarray of bool
+        ``table[i, s]`` (or ``table[i, k, s]`` when ``size`` is given) is
+        True when some subset of the first i values (of k elements) sums to s
+    """
+    values = _as_values(values)
+    if size is None:
+        table = np.zeros((len(values) + 1, target + 1), dtype=bool)
+        table[0, 0] = True
+        for i, v in enumerate(values):
+            table[i + 1] = table[i]
+            if v <= target:
+                table[i + 1, v:] |= table[i, :target + 1 - v]
+        return table
+    table = np.zeros((len(values) + 1, size + 1, target + 1), dtype=bool)
+    table[0, 0, 0] = True
+    for i, v in enumerate(values):
+        table[i + 1] = table[i]
+        if v <= target and size > 0:
+            table[i + 1, 1:, v:] |= table[i, :-1, :target + 1 - v]
+    return table
+
+
+def _walk_table(values: np.ndarray, table: np.ndarray, target: int,
+                size: Optional[int]) -> Iterator[List[int]]:
+    # Backtrack through a table from ``subset_table`` built with the same
+    # values, target and size
+    if size is None:
+        if not table[len(values), target]:
+            return
+        # Chosen values are kept as a linked (value, rest) chain so branches
+        # share their tails instead of copying lists
+        stack = [(len(values), target, None)]
+        while stack:
+            i, s, chosen = stack.pop()
+            if i == 0:
+                subset = []
+                while chosen is not None:
+                    value, chosen = chosen
+                    subset.append(value)
+                yield subset
+                continue
+            v = int(values[i - 1])
+            if s >= v and table[i - 1, s - v]:
+                stack.append((i - 1, s - v, (v, chosen)))
+            if table[i - 1, s]:
+                stack.append((i - 1, s, chosen))
+        return
+    if not table[len(values), size, target]:
+        return
+    stack = [(len(values), size, target, None)]
+    while stack:
+        i, k, s, chosen = stack.pop()
+        if i == 0:
+            subset = []
+            while chosen is not None:
+                value, chosen = chosen
+                subset.append(value)
+            yield subset
+            continue
+        v = int(values[i - 1])
+        if k > 0 and s >= v and table[i - 1, k - 1, s - v]:
+            stack.append((i - 1, k - 1, s - v, (v, chosen)))
+        if table[i - 1, k, s]:
+            stack.append((i - 1, k, s, chosen))
+
+
+def iter_subsets(values: Iterable[int], target: int, size: Optional[int] = None) -> Iterator[List[int]]:
+    """
+    Lazily enumerate the subsets of ``values`` summing to ``target``.
+
+    The reachability table prunes every dead branch, so each subset costs
+    O(len(values)) to produce no matter how many other subsets there are.
+
+    Parameters:
+    -----------
+    values : iterable of int
+        Non-negative integers
+    target : int
+        Required sum
+    size : int, optional
+        Only yield subsets with exactly this many elements
+
+    Yields:
+    -------
+    list of int
+        Values of one subset, in their original order
+    """
+    values = _as_values(values)
+    if target < 0 or (size is not None and size < 0):
+        return
+    yield from _walk_table(values, subset_table(values, target, size), target, size)
+
+
+def _reachable_by_size(values: np.ndarray, target: int) -> np.ndarray:
+    # reachable[k, s]: some k-element subset of all the values sums to s.
+    # Same recurrence as count_subsets_by_size, on booleans.
+    reachable = np.zeros((len(values) + 1, target + 1), dtype=bool)
+    reachable[0, 0] = True
+    for i, v in enumerate(values):
+        if v > target:
+            continue
+        reachable[1:i + 2, v:] = reachable[1:i + 2, v:] | reachable[:i + 1, :target + 1 - v]
+    return reachable
+
+
+def count_two_target(values: Iterable[int], target1: int, target2: int,
+                     modulo: Optional[int] = None) -> int:
+    """
+    Number of pairs (A, B) of equal-size, non-empty subsets with
+    sum(A) == target1 and sum(B) == target2.
+
+    A and B are chosen independently and may share elements, which is what
+    the test cases of ``twoSubsequences`` expect. The notebook's
+    ``find_2_target`` also required them to be disjoint.
+
+    Parameters:
+    -----------
+    values : iterable of int
+        Non-negative integers
+    target1, target2 : int
+        Required sums of A and B
+    modulo : int, optional
+        Reduce counts modulo this number
+
+    Returns:
+    --------
+    int
+        Pair count, modulo ``modulo`` if given
+    """
+    if target1 < 0 or target2 < 0:
+        return 0
+    counts = count_subsets_by_size(values, max(target1, target2), modulo)
+    total = 0
+    for k in range(1, counts.shape[0]):
+        total += int(counts[k, target1]) * int(counts[k, target2])
+        if modulo is not None:
+            total %= modulo
+    return total
+
+
+def iter_two_target(values: Iterable[int], target1: int, target2: int) -> Iterator[Tuple[List[int], List[int]]]:
+    """
+    Lazily enumerate the pairs counted by ``count_two_target``.
+
+    Sizes that cannot reach both targets are skipped using one
+    (len(values) + 1) x (max target + 1) table; for the others, a size-k
+    table is built once for A and once for B.
+
+    Yields:
+    -------
+    tuple of list
+        (A, B), each in original order, grouped by increasing size
+    """
+    values = _as_values(values)
+    if target1 < 0 or target2 < 0:
+        return
+    reachable = _reachable_by_size(values, max(target1, target2))
+    for k in range(1, len(values) + 1):
+        if reachable[k, target1] and reachable[k, target2]:
+            # B's table is built once per size and shared by every A, so
+            # each pair after the first costs O(len(values))
+            table2 = subset_table(values, target2, k)
+            for a in iter_subsets(values, target1, k):
+                for b in _walk_table(values, table2, target2, k):
+                    yield a, b
+
+
+def two_subsequences(x: Iterable[int], r: int, s: int, modulo: int = 10 ** 9 + 7) -> int:
+    """
+    Drop-in for the notebook's ``twoSubsequences``.
+
+    Counts pairs of equal-length subsequences A, B with
+    sum(A) + sum(B) == r and sum(A) - sum(B) == s, i.e. sum(A) == (r + s) / 2
+    and sum(B) == (r - s) / 2.
+
+    Returns:
+    --------
+    int
+        Pair count modulo ``modulo``; 0 when the sums are not integers or
+        would be negative
+    """
+    if (r + s) % 2 or s > r:
+        return 0
+    return count_two_target(x, (r + s) // 2, (r - s) // 2, modulo)
+
+
+def find(arr: Iterable[int], target: int) -> Tuple[int, List[List[int]]]:
+    """
+    Drop-in for the notebook's ``find``: the count and every subset.
+
+    Prefer ``count_subsets`` or ``iter_subsets`` when the subsets
+    themselves are not all needed at once.
+    """
+    return count_subsets(arr, target), list(iter_subsets(arr, target))